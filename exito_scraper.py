@@ -25,6 +25,8 @@ SHEET_NAME         – Name of the sheet/tab (default: EXITO PRODUCTOS GPT)
 GOOGLE_CREDENTIALS_JSON – Contents of the service account JSON key
 BATCH_SIZE         – Number of rows to process per run (default: 100)
 TIME_ZONE          – IANA time zone (default: America/Bogota)
+MAX_PARALLEL_PAGES – Number of product pages scraped concurrently (default: 6)
+BROWSER_PROFILE_DIR – Chromium profile kept between runs (default: .pw-cache)
 ```
 
 The script writes the current cursor position into cell A100000 of the
@@ -41,17 +43,185 @@ the workflow and set GOOGLE_CREDENTIALS_JSON as a secret.
 """
 
 import asyncio
+import functools
 import json
 import os
+import random
 import re
+import time
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo  # Python 3.9+
+except ImportError:
+    from backports.zoneinfo import ZoneInfo  # fallback if backport is installed
 
 import gspread
+import httpx
+import orjson
+import requests
+from gspread.exceptions import APIError
 from oauth2client.service_account import ServiceAccountCredentials
 from playwright.async_api import async_playwright
 
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+_PRICE_RE = re.compile(r"(\d[\d\.\,]+)")
+_VENDOR_RE = re.compile(r"Vendido por[:\s]*([^\n\r]+)", re.IGNORECASE)
+# Only real Éxito product URLs are worth a fetch; blanks and other hosts are skipped.
+_URL_OK = re.compile(r"^https?://(?:www\.)?exito\.com/", re.IGNORECASE)
+_JSONLD_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>([\s\S]*?)</script>", re.IGNORECASE
+)
+# Resources the scraper never inspects (price and JSON-LD live in the HTML)
+# and third-party trackers that only slow pages down.  Images are disabled
+# separately through a Chromium flag since their URLs often lack an extension.
+BLOCKED_URL_PATTERNS = (
+    "*.css*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.mp4*",
+    "*.webm*",
+    "*googletagmanager*",
+    "*facebook*",
+    "*hotjar*",
+    "*doubleclick*",
+)
+CHROMIUM_ARGS = ["--blink-settings=imagesEnabled=false"]
+# Once all of these are attached the visible seller and price can be read.
+# JSON-LD is not one of them: it is the same server-rendered block the HTTP
+# fast path already parsed, so its presence says nothing about the seller.
+READY_SELECTORS = ("text=Vendido por", "[class*='price']")
+# Accept button of the cookie consent banner.
+COOKIE_ACCEPT_SELECTOR = "button:has-text('Aceptar')"
+# Bound on any single navigation, in milliseconds.
+NAVIGATION_TIMEOUT_MS = 15000
+# Runs in the page and returns, in one round-trip, the candidate price and
+# vendor texts (one per selector, in priority order), the JSON-LD script
+# texts and JSON-safe copies of the window.dataLayer entries.
+_EXTRACT_JS = """
+() => {
+    const text = (el) => (el ? el.innerText || "" : "");
+    const first = (sel) => text(document.querySelector(sel));
+    // Like Playwright's text matching, ignore text inside script/style/noscript
+    const skip = new Set(["SCRIPT", "STYLE", "NOSCRIPT"]);
+    const seen = new Map();
+    const visibleText = (el) => {
+        if (skip.has(el.tagName)) return "";
+        if (seen.has(el)) return seen.get(el);
+        let out = "";
+        for (const node of el.childNodes) {
+            if (node.nodeType === Node.TEXT_NODE) out += node.nodeValue;
+            else if (node.nodeType === Node.ELEMENT_NODE) out += visibleText(node);
+        }
+        out = out.toLowerCase();
+        seen.set(el, out);
+        return out;
+    };
+    const has = (el, needle) => visibleText(el).includes(needle);
+    const firstWith = (sel, needle) =>
+        text([...document.querySelectorAll(sel)].find((el) => has(el, needle)));
+    const deepestWith = (needle) =>
+        text(
+            [...(document.body || document).querySelectorAll("*")].find(
+                (el) => has(el, needle) && ![...el.children].some((child) => has(child, needle))
+            )
+        );
+    // Copy entries one by one so a circular entry only drops itself
+    const dl = [];
+    for (const entry of Array.isArray(window.dataLayer) ? window.dataLayer : []) {
+        try {
+            dl.push(JSON.parse(JSON.stringify(entry)));
+        } catch (e) {}
+    }
+    return {
+        price: [
+            first("span[class*='price']"),
+            first("div[class*='price'] span"),
+            first("span[data-testid*='price']"),
+            firstWith("span", "$"),
+            firstWith("div", "$"),
+        ],
+        vendor: [
+            deepestWith("vendido por"),
+            firstWith("span", "vendido por"),
+            firstWith("div", "vendido por"),
+        ],
+        ld: [...document.querySelectorAll("script[type='application/ld+json']")].map(
+            (el) => el.textContent || ""
+        ),
+        dl,
+    };
+}
+"""
+# Sheets API status codes worth retrying (quota exhaustion and server errors).
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Transport failures (including SHEETS_TIMEOUT_S expiring) worth retrying.
+RETRY_TRANSPORT_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+# Per-request timeout for Sheets API calls, in seconds.
+SHEETS_TIMEOUT_S = 30
+
+
+
+async def _block_unneeded(page) -> None:
+    """Block heavy or tracking resources for ``page`` at the network layer.
+
+    Uses CDP ``Network.setBlockedURLs`` rather than ``context.route``
+    because Playwright turns off the HTTP cache for routed contexts, and
+    the persisted browser cache is what keeps VTEX's JS bundles local.
+    """
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+
+
+
+async def _wait_until_ready(page, timeout: float = 6.0) -> None:
+    """Wait until the seller and price elements are attached, at most ``timeout`` s.
+
+    VTEX pages keep firing beacons long after the data we need is in the
+    DOM, so waiting for ``networkidle`` wastes seconds per URL.  A timeout
+    here is not an error: extraction still runs on whatever has loaded.
+    """
+    tasks = [
+        asyncio.ensure_future(page.wait_for_selector(sel, state="attached", timeout=timeout * 1000))
+        for sel in READY_SELECTORS
+    ]
+    try:
+        await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.ALL_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+
+async def _dismiss_cookie_banner(page) -> None:
+    """Accept the cookie banner if it is shown.
+
+    The consent cookie then lives in the browser context (and its
+    persisted profile), so this only needs to happen once per run.
+    """
+    try:
+        button = await page.query_selector(COOKIE_ACCEPT_SELECTOR)
+        if button:
+            await button.click(timeout=2000)
+    except Exception:
+        pass
+
+
+
+@functools.lru_cache(maxsize=4)
+def _tz(name: str) -> ZoneInfo:
+    """Return the (cached) ZoneInfo for an IANA timezone name."""
+    return ZoneInfo(name)
+
+
 
 def _should_run_now(time_zone: str = "America/Bogota") -> bool:
     """Return True if current local time is within allowed window.
@@ -66,12 +236,7 @@ def _should_run_now(time_zone: str = "America/Bogota") -> bool:
     Returns:
         bool: True if within allowed hours, False otherwise.
     """
-    try:
-        from zoneinfo import ZoneInfo  # Python 3.9+
-    except ImportError:
-        from backports.zoneinfo import ZoneInfo  # fallback if backport is installed
-
-    now = datetime.now(ZoneInfo(time_zone))
+    now = datetime.now(_tz(time_zone))
     # weekday: Monday=0, Sunday=6
     if now.weekday() == 6:  # Sunday
         return False
@@ -79,6 +244,36 @@ def _should_run_now(time_zone: str = "America/Bogota") -> bool:
 
 
 
+def _with_retry(fn: Callable[..., Any], *args: Any, retries: int = 5, base: float = 1.0, **kwargs: Any) -> Any:
+    """Call a gspread function, retrying quota, server and transport errors.
+
+    Waits ``base * 2**attempt`` seconds plus up to one second of jitter
+    between attempts.  Other API errors, and the last failure, are raised.
+
+    Args:
+        fn: Function to call.
+        *args: Positional arguments for ``fn``.
+        retries: Maximum number of attempts.
+        base: Initial backoff in seconds.
+        **kwargs: Keyword arguments for ``fn``.
+
+    Returns:
+        Any: Whatever ``fn`` returns.
+    """
+    for attempt in range(retries):
+        try:
+            return fn(*args, **kwargs)
+        except APIError as exc:
+            status = getattr(exc.response, "status_code", None)
+            if status not in RETRY_STATUS_CODES or attempt == retries - 1:
+                raise
+        except RETRY_TRANSPORT_ERRORS:
+            if attempt == retries - 1:
+                raise
+        time.sleep(base * (2 ** attempt) + random.random())
+
+
+
 def _open_sheet() -> gspread.Worksheet:
     """Authenticate and return the target worksheet.
 
@@ -98,26 +293,45 @@ def _open_sheet() -> gspread.Worksheet:
     scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
     credentials = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
     client = gspread.authorize(credentials)
-    spreadsheet = client.open(spreadsheet_name)
-    worksheet = spreadsheet.worksheet(sheet_name)
+    # gspread keeps one pooled authorized session per client, so connections
+    # are already reused; bound each request so a stalled call cannot hang the
+    # run (gspread 6 moved the HTTP settings to client.http_client).
+    getattr(client, "http_client", client).set_timeout(SHEETS_TIMEOUT_S)
+    spreadsheet = _with_retry(client.open, spreadsheet_name)
+    worksheet = _with_retry(spreadsheet.worksheet, sheet_name)
     return worksheet
 
 
 
-def _read_batch(worksheet: gspread.Worksheet, batch_size: int) -> Tuple[int, List[str]]:
+def _index_header(header: List[str]) -> Dict[str, int]:
+    """Map normalized (stripped, upper-case) header names to 1-based columns."""
+    return {val.strip().upper(): idx for idx, val in enumerate(header, start=1)}
+
+
+
+def _read_batch(
+    worksheet: gspread.Worksheet, batch_size: int
+) -> Tuple[int, List[str], Dict[str, int], int]:
     """Read a batch of product URLs starting from the cursor.
 
     The cursor is stored in cell A100000. If empty, start at row 2.
+    Cursor, header and data rows are fetched in a single batch request.
 
     Args:
         worksheet: The worksheet to read from.
         batch_size: Number of rows to read.
 
     Returns:
-        Tuple[int, List[str]]: (start_row, list of URLs)
+        Tuple[int, List[str], Dict[str, int], int]: (start_row, list of URLs,
+        header index from ``_index_header``, last row with a URL)
     """
+    # Data rows stop just above the cursor cell so it is never read as a URL
+    last_row = min(worksheet.row_count, 99999)
+    cursor_block, header_block, rows = _with_retry(
+        worksheet.batch_get, ["A100000", "1:1", f"2:{last_row}"], major_dimension="ROWS"
+    )
     try:
-        cursor_val = worksheet.acell("A100000").value
+        cursor_val = cursor_block[0][0] if cursor_block and cursor_block[0] else None
         start_row = int(cursor_val) if cursor_val else 2
     except Exception:
         start_row = 2
@@ -125,24 +339,20 @@ def _read_batch(worksheet: gspread.Worksheet, batch_size: int) -> Tuple[int, Lis
     if start_row < 2:
         start_row = 2
 
-    # Read the entire column for URLs
-    col_values = worksheet.col_values(1)  # We'll find URL header later; but first column not used.
-    header = worksheet.row_values(1)
+    header_index = _index_header(header_block[0] if header_block else [])
     # Determine URL column index (1-based)
-    url_col_idx = None
-    for idx, val in enumerate(header, start=1):
-        if val.strip().upper() == "URL":
-            url_col_idx = idx
-            break
+    url_col_idx = header_index.get("URL")
     if url_col_idx is None:
         raise RuntimeError("No 'URL' column found in header row")
-    # Get data rows for URL column
-    total_rows = worksheet.row_count
-    end_row = min(start_row + batch_size - 1, total_rows)
-    urls: List[str] = worksheet.get(f"{gspread.utils.rowcol_to_a1(start_row, url_col_idx)}:" f"{gspread.utils.rowcol_to_a1(end_row, url_col_idx)}")
-    # Flatten list of lists
-    urls_flat = [row[0] for row in urls]
-    return start_row, urls_flat
+    # Slice the URL column locally; rows[0] is sheet row 2
+    col_urls = [row[url_col_idx - 1].strip() if len(row) >= url_col_idx else "" for row in rows]
+    last_data_row = 1
+    for offset, url in enumerate(col_urls):
+        if url:
+            last_data_row = offset + 2
+    end_row = min(start_row + batch_size - 1, last_data_row)
+    urls_flat = col_urls[start_row - 2 : end_row - 1]
+    return start_row, urls_flat, header_index, last_data_row
 
 
 
@@ -152,11 +362,16 @@ def _write_results(
     sellers: List[str],
     prices: List[str],
     time_zone: str = "America/Bogota",
+    header_index: Optional[Dict[str, int]] = None,
+    next_row: Optional[int] = None,
 ) -> None:
     """Write seller and price results back to the sheet.
 
     Finds columns 'VENDEDOR' and 'PRECIO VEI' by header names. Optionally
     writes a timestamp to a column called 'ACTUALIZADO' if it exists.
+    All columns, and the cursor when ``next_row`` is given, are sent in a
+    single batch update request so the cursor only advances if the
+    results are written.
 
     Args:
         worksheet: Target worksheet.
@@ -164,60 +379,215 @@ def _write_results(
         sellers: List of seller strings.
         prices: List of price strings.
         time_zone: IANA timezone for timestamps.
+        header_index: Header index returned by ``_read_batch``; the header
+            row is fetched if omitted.
+        next_row: Cursor value to store in A100000 for the next run.
     """
-    header = worksheet.row_values(1)
-    col_seller = None
-    col_price = None
-    col_ts = None
-    for idx, val in enumerate(header, start=1):
-        name = val.strip().upper()
-        if name == "VENDEDOR":
-            col_seller = idx
-        elif name == "PRECIO VEI":
-            col_price = idx
-        elif name == "ACTUALIZADO":
-            col_ts = idx
+    if header_index is None:
+        header_index = _index_header(_with_retry(worksheet.row_values, 1))
+    col_seller = header_index.get("VENDEDOR")
+    col_price = header_index.get("PRECIO VEI")
+    col_ts = header_index.get("ACTUALIZADO")
     if col_seller is None or col_price is None:
         raise RuntimeError("Columns 'VENDEDOR' and/or 'PRECIO VEI' not found")
     # Build update ranges
     end_row = start_row + len(sellers) - 1
     seller_range = f"{gspread.utils.rowcol_to_a1(start_row, col_seller)}:" f"{gspread.utils.rowcol_to_a1(end_row, col_seller)}"
     price_range = f"{gspread.utils.rowcol_to_a1(start_row, col_price)}:" f"{gspread.utils.rowcol_to_a1(end_row, col_price)}"
-    seller_cells = worksheet.range(seller_range)
-    price_cells = worksheet.range(price_range)
-    for idx, cell in enumerate(seller_cells):
-        cell.value = sellers[idx]
-    for idx, cell in enumerate(price_cells):
-        cell.value = prices[idx]
-    updates = seller_cells + price_cells
+    data = [
+        {"range": seller_range, "values": [[seller] for seller in sellers]},
+        {"range": price_range, "values": [[price] for price in prices]},
+    ]
     # Timestamp column if present
     if col_ts is not None:
         ts_range = f"{gspread.utils.rowcol_to_a1(start_row, col_ts)}:" f"{gspread.utils.rowcol_to_a1(end_row, col_ts)}"
-        ts_cells = worksheet.range(ts_range)
+        now_str = datetime.now(_tz(time_zone)).strftime("%Y-%m-%d %H:%M:%S")
+        data.append({"range": ts_range, "values": [[now_str]] * len(sellers)})
+    if next_row is not None:
+        data.append({"range": "A100000", "values": [[str(next_row)]]})
+    # gspread 6 prefixes each data[i]["range"] in place, so every attempt
+    # needs its own copy or a retry would send a doubly-prefixed range
+    _with_retry(
+        lambda: worksheet.batch_update([dict(entry) for entry in data], value_input_option="USER_ENTERED")
+    )
+
+
+
+def _parse_jsonld(html: str, brand_fallback: bool = True) -> Tuple[str, str]:
+    """Extract price and vendor from the JSON-LD blocks embedded in HTML.
+
+    Args:
+        html: Page HTML containing ``<script type="application/ld+json">`` tags.
+        brand_fallback: Use the product brand as vendor when no offer
+            names a seller.
+
+    Returns:
+        Tuple[str, str]: (price, vendor) – empty strings when not found.
+    """
+    # find all <script type="application/ld+json">
+    blobs = [m.group(1) for m in _JSONLD_RE.finditer(html)]
+    return _parse_jsonld_blobs(blobs, brand_fallback=brand_fallback)
+
+
+
+def _offer_seller(offers: Any) -> str:
+    """Return the seller name of an offer, looking inside AggregateOffer.offers."""
+    if not isinstance(offers, dict):
+        return ""
+    seller = offers.get("seller")
+    if isinstance(seller, dict):
+        name = seller.get("name") or seller.get("@name") or ""
+        if name:
+            return name
+    nested = offers.get("offers")
+    if isinstance(nested, dict):
+        nested = [nested]
+    if isinstance(nested, list):
+        for offer in nested:
+            name = _offer_seller(offer)
+            if name:
+                return name
+    return ""
+
+
+
+def _parse_jsonld_blobs(blobs: List[str], brand_fallback: bool = True) -> Tuple[str, str]:
+    """Extract price and vendor from schema.org Product JSON-LD texts.
+
+    Args:
+        blobs: Raw contents of the ``application/ld+json`` script tags.
+        brand_fallback: Use the product brand as vendor when no offer
+            names a seller.
+
+    Returns:
+        Tuple[str, str]: (price, vendor) – empty strings when not found.
+    """
+    price = ""
+    vendor = ""
+    for blob in blobs:
         try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            from backports.zoneinfo import ZoneInfo  # fallback
-        now_str = datetime.now(ZoneInfo(time_zone)).strftime("%Y-%m-%d %H:%M:%S")
-        for cell in ts_cells:
-            cell.value = now_str
-        updates += ts_cells
-    worksheet.update_cells(updates, value_input_option="USER_ENTERED")
+            raw = blob.strip()
+            data = orjson.loads(raw)
+            nodes = data if isinstance(data, list) else [data]
+            for node in nodes:
+                # unwrap @graph
+                subnodes = node.get("@graph") if isinstance(node, dict) else None
+                if subnodes and isinstance(subnodes, list):
+                    nodes.extend(subnodes)
+            for node in nodes:
+                if not isinstance(node, dict):
+                    continue
+                types = node.get("@type")
+                if not types:
+                    continue
+                # unify to list
+                type_list = types if isinstance(types, list) else [types]
+                if "Product" not in type_list:
+                    continue
+                offers = node.get("offers")
+                if isinstance(offers, list):
+                    offers = offers[0]
+                if isinstance(offers, dict):
+                    if not price:
+                        p = offers.get("price") or offers.get("lowPrice") or offers.get("highPrice") or ""
+                        if p:
+                            price = str(p).strip()
+                    if not vendor:
+                        vendor = _offer_seller(offers)
+                if brand_fallback and not vendor and node.get("brand"):
+                    brand = node.get("brand")
+                    if isinstance(brand, dict):
+                        vendor = brand.get("name") or ""
+                    elif isinstance(brand, str):
+                        vendor = brand
+                if price and vendor:
+                    break
+            if price and vendor:
+                break
+        except Exception:
+            continue
+    return price, vendor
+
 
 
+def _parse_datalayer(entries: List[dict]) -> Tuple[str, str]:
+    """Extract price and vendor from ``window.dataLayer`` entries.
 
-async def _extract_price_vendor(page, url: str) -> Tuple[str, str]:
+    Args:
+        entries: Objects pushed to the page's dataLayer.
+
+    Returns:
+        Tuple[str, str]: (price, vendor) – empty strings when not found.
+    """
+    price = ""
+    vendor = ""
+    for obj in entries:
+        if not isinstance(obj, dict):
+            continue
+        if not price:
+            p = obj.get("price") or obj.get("productPrice") or ""
+            if p:
+                price = str(p)
+        if not vendor:
+            v = obj.get("seller") or obj.get("sellerName") or ""
+            if v:
+                vendor = str(v)
+        if price and vendor:
+            break
+    return price, vendor
+
+
+
+def _normalize(price: str, vendor: str) -> Tuple[str, str]:
+    """Apply 'NO DISPONIBLE' defaults and the 'Vendido por' vendor label."""
+    price = price.strip() if price else "NO DISPONIBLE"
+    vendor = vendor.strip() if vendor else "NO DISPONIBLE"
+    if vendor != "NO DISPONIBLE" and not vendor.lower().startswith("vendido por"):
+        vendor = f"Vendido por: {vendor}"
+    return price, vendor
+
+
+
+async def _fetch_static(client: httpx.AsyncClient, url: str) -> Tuple[str, str]:
+    """Fetch a product page without a browser and parse its JSON-LD.
+
+    VTEX usually server-renders the Product JSON-LD, so a plain GET is
+    enough for most URLs.  Any failure yields empty strings so the caller
+    can fall back to Playwright.  The brand is never used as vendor here:
+    when no offer names a seller the vendor stays empty, so the browser
+    path can read the visible "Vendido por" seller instead.
+
+    Args:
+        client: Shared HTTP client.
+        url: URL to fetch.
+
+    Returns:
+        Tuple[str, str]: (price, vendor) – empty strings when not found.
+    """
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except Exception:
+        return "", ""
+    # Regex and JSON parsing of the full HTML run off the event loop
+    return await asyncio.to_thread(_parse_jsonld, response.text, brand_fallback=False)
+
+
+
+async def _extract_price_vendor(page, url: str, dismiss_banner: bool = False) -> Tuple[str, str]:
     """Extract the price and vendor from a product page.
 
-    Playwright opens the page, waits for network to settle, and tries
-    multiple strategies to extract price and vendor:
+    Playwright opens the page, waits for price data to appear, collects
+    candidate texts with a single ``page.evaluate`` call (``_EXTRACT_JS``)
+    and tries multiple strategies to extract price and vendor:
     1. Inspecting visible elements that contain a currency and seller.
     2. Parsing JSON-LD blocks for schema.org Product objects.
-    3. Parsing dataLayer pushes if present.
+    3. Reading ``window.dataLayer`` entries if present.
 
     Args:
         page: The Playwright Page object.
         url: URL to visit.
+        dismiss_banner: Whether to look for and accept the cookie banner.
 
     Returns:
         Tuple[str, str]: (price, vendor) – returns 'NO DISPONIBLE' if not found.
@@ -225,118 +595,148 @@ async def _extract_price_vendor(page, url: str) -> Tuple[str, str]:
     price = ""
     vendor = ""
     try:
-        await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+        # Return as soon as the response starts; a committed navigation means
+        # the new document has replaced the previous product's
+        await page.goto(url, wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
         try:
-            await page.wait_for_load_state("networkidle", timeout=15000)
+            await page.wait_for_load_state("domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
         except Exception:
-            pass
+            pass  # read whatever has been parsed so far
+        await _wait_until_ready(page)
+        if dismiss_banner:
+            await _dismiss_cookie_banner(page)
+        # Collect everything in one round-trip, then parse it in Python
+        data = await page.evaluate(_EXTRACT_JS)
         # 1) Try visible elements for price (contains digits and currency symbol)
-        price_selectors = [
-            "span[class*='price']",
-            "div[class*='price'] span",
-            "span[data-testid*='price']",
-            "span:has-text('$')",
-            "div:has-text('$')",
-        ]
-        for css in price_selectors:
-            element = await page.query_selector(css)
-            if element:
-                text = (await element.inner_text()) or ""
-                match = re.search(r"(\d[\d\.\,]+)", text)
-                if match:
-                    price = match.group(1)
-                    break
+        for text in data["price"]:
+            match = _PRICE_RE.search(text or "")
+            if match:
+                price = match.group(1)
+                break
         # 2) Vendor visible (e.g. 'Vendido por')
-        vendor_selectors = [
-            "text=Vendido por",
-            "span:has-text('Vendido por')",
-            "div:has-text('Vendido por')",
-        ]
-        for sel in vendor_selectors:
-            element = await page.query_selector(sel)
-            if element:
-                text = (await element.inner_text()) or ""
-                match = re.search(r"Vendido por[:\s]*([^\n\r]+)", text, re.IGNORECASE)
-                if match:
-                    vendor = match.group(1).strip()
-                    break
-        # 3) JSON-LD extraction
+        for text in data["vendor"]:
+            match = _VENDOR_RE.search(text or "")
+            if match:
+                vendor = match.group(1).strip()
+                break
+        # 3) JSON-LD extraction from the script tags' text
         if not price or not vendor:
-            html = await page.content()
-            # find all <script type="application/ld+json">
-            for m in re.finditer(
-                r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>([\s\S]*?)</script>", html, re.IGNORECASE
-            ):
-                try:
-                    raw = m.group(1).strip()
-                    data = json.loads(raw)
-                    nodes = data if isinstance(data, list) else [data]
-                    for node in nodes:
-                        # unwrap @graph
-                        subnodes = node.get("@graph") if isinstance(node, dict) else None
-                        if subnodes and isinstance(subnodes, list):
-                            nodes.extend(subnodes)
-                    for node in nodes:
-                        if not isinstance(node, dict):
-                            continue
-                        types = node.get("@type")
-                        if not types:
-                            continue
-                        # unify to list
-                        type_list = types if isinstance(types, list) else [types]
-                        if "Product" not in type_list:
-                            continue
-                        offers = node.get("offers")
-                        if isinstance(offers, list):
-                            offers = offers[0]
-                        if isinstance(offers, dict):
-                            if not price:
-                                p = offers.get("price") or offers.get("lowPrice") or offers.get("highPrice") or ""
-                                if p:
-                                    price = str(p).strip()
-                            if not vendor:
-                                s = offers.get("seller")
-                                if isinstance(s, dict):
-                                    vendor = s.get("name") or s.get("@name") or ""
-                        if not vendor and node.get("brand"):
-                            brand = node.get("brand")
-                            if isinstance(brand, dict):
-                                vendor = brand.get("name") or ""
-                            elif isinstance(brand, str):
-                                vendor = brand
-                        if price and vendor:
-                            break
-                    if price and vendor:
-                        break
-                except Exception:
-                    continue
-        # 4) dataLayer extraction
+            ld_price, ld_vendor = await asyncio.to_thread(_parse_jsonld_blobs, data["ld"])
+            price = price or ld_price
+            vendor = vendor or ld_vendor
+        # 4) dataLayer extraction from the live window.dataLayer array
         if not price or not vendor:
-            html = await page.content()
-            for m in re.finditer(r"dataLayer\.push\((\{[\s\S]*?\})\);", html, re.IGNORECASE):
-                try:
-                    obj = json.loads(m.group(1))
-                    if not price:
-                        p = obj.get("price") or obj.get("productPrice") or ""
-                        if p:
-                            price = str(p)
-                    if not vendor:
-                        v = obj.get("seller") or obj.get("sellerName") or ""
-                        if v:
-                            vendor = v
-                    if price and vendor:
-                        break
-                except Exception:
-                    continue
+            dl_price, dl_vendor = _parse_datalayer(data["dl"])
+            price = price or dl_price
+            vendor = vendor or dl_vendor
     except Exception:
         pass
-    # Normalize values
-    price = price.strip() if price else "NO DISPONIBLE"
-    vendor = vendor.strip() if vendor else "NO DISPONIBLE"
-    # Prepend label
-    if vendor != "NO DISPONIBLE" and not vendor.lower().startswith("vendido por"):
-        vendor = f"Vendido por: {vendor}"
-    return price, vendor
+    return _normalize(price, vendor)
+
+
+
+async def _scrape_static(urls: List[str]) -> List[Tuple[str, str]]:
+    """Fetch all URLs concurrently over one HTTP/2 client.
+
+    Returns:
+        List[Tuple[str, str]]: Raw (price, vendor) per URL, in input order.
+    """
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT, "Accept-Language": "es-CO"},
+    ) as client:
+        return await asyncio.gather(*(_fetch_static(client, url) for url in urls))
+
+
+
+async def _scrape_with_browser(
+    urls: List[str], max_parallel: int, profile_dir: str = ".pw-cache"
+) -> List[Tuple[str, str]]:
+    """Scrape URLs with Playwright using up to ``max_parallel`` pages at once.
+
+    A persistent Chromium profile in ``profile_dir`` keeps the HTTP cache
+    and cookies between runs.  Each worker owns a single page that it
+    navigates from URL to URL, writing results by index so input order is
+    preserved.
+
+    Returns:
+        List[Tuple[str, str]]: Normalized (price, vendor) per URL, in input order.
+    """
+    # A restored profile may carry lock files from the machine that saved it
+    for name in ("SingletonLock", "SingletonCookie", "SingletonSocket"):
+        try:
+            os.remove(os.path.join(profile_dir, name))
+        except OSError:
+            pass
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            profile_dir,
+            headless=True,
+            args=CHROMIUM_ARGS,
+            user_agent=USER_AGENT,
+            locale="es-CO",
+            java_script_enabled=True,
+            viewport={"width": 800, "height": 600},
+        )
+        try:
+            context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+            queue: asyncio.Queue = asyncio.Queue()
+            for item in enumerate(urls):
+                queue.put_nowait(item)
+            results: List[Tuple[str, str]] = [("NO DISPONIBLE", "NO DISPONIBLE")] * len(urls)
+            # Pages share the context's cookies, so the banner is accepted once
+            banner_pending = True
+
+            async def worker() -> None:
+                nonlocal banner_pending
+                # Reuse one page for every URL this worker takes off the queue
+                page = await context.new_page()
+                try:
+                    try:
+                        await _block_unneeded(page)
+                    except Exception as exc:
+                        # Blocking only saves bandwidth; scrape unblocked
+                        print(f"Could not block resources, continuing without: {exc!r}")
+                    while not queue.empty():
+                        i, url = queue.get_nowait()
+                        dismiss, banner_pending = banner_pending, False
+                        results[i] = await _extract_price_vendor(page, url, dismiss_banner=dismiss)
+                finally:
+                    await page.close()
+
+            # A failed worker leaves its URLs as NO DISPONIBLE instead of
+            # discarding what the other workers already scraped
+            outcomes = await asyncio.gather(
+                *(worker() for _ in range(min(max_parallel, len(urls)))), return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    print(f"Browser worker failed: {outcome!r}")
+        finally:
+            await context.close()
+    return results
+
+
+
+async def _scrape(urls: List[str], max_parallel: int, profile_dir: str) -> List[Tuple[str, str]]:
+    """Scrape URLs over plain HTTP first, then with Playwright where needed.
+
+    Returns:
+        List[Tuple[str, str]]: Normalized (price, vendor) per URL, in input order.
+    """
+    # Fast path: plain HTTP for pages whose JSON-LD is server-rendered
+    static = await _scrape_static(urls)
+    results = [_normalize(price, vendor) for price, vendor in static]
+    pending = [i for i, (price, vendor) in enumerate(static) if not (price and vendor)]
+    if pending:
+        browser_results = await _scrape_with_browser(
+            [urls[i] for i in pending], max_parallel, profile_dir
+        )
+        for i, result in zip(pending, browser_results):
+            results[i] = result
+    return results
 
 
 
@@ -349,40 +749,32 @@ async def main() -> None:
         return
     batch_size = int(os.environ.get("BATCH_SIZE", "100"))
     worksheet = _open_sheet()
-    start_row, urls = _read_batch(worksheet, batch_size)
+    start_row, urls, header_index, last_data_row = _read_batch(worksheet, batch_size)
     if not urls:
         # reset cursor and try again
-        worksheet.update_acell("A100000", "2")
-        start_row, urls = _read_batch(worksheet, batch_size)
+        _with_retry(worksheet.update_acell, "A100000", "2")
+        start_row, urls, header_index, last_data_row = _read_batch(worksheet, batch_size)
         if not urls:
             print("No URLs found to process.")
             return
-    sellers: List[str] = []
-    prices: List[str] = []
-    # Launch Playwright
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            locale="es-CO",
-        )
-        page = await context.new_page()
-        for url in urls:
-            price, vendor = await _extract_price_vendor(page, url)
-            prices.append(price)
-            sellers.append(vendor)
-        await context.close()
-        await browser.close()
-    # Write back to sheet
-    _write_results(worksheet, start_row, sellers, prices, time_zone=tz)
-    # Update cursor for next run
+    max_parallel = max(1, int(os.environ.get("MAX_PARALLEL_PAGES", "6")))
+    profile_dir = os.environ.get("BROWSER_PROFILE_DIR", ".pw-cache")
+    # Scrape each distinct valid URL once, then map results back to every
+    # row; rows with invalid URLs are written as not available
+    unique_urls = [url for url in dict.fromkeys(urls) if _URL_OK.match(url)]
+    by_url = dict(zip(unique_urls, await _scrape(unique_urls, max_parallel, profile_dir)))
+    results = [by_url.get(url, ("NO DISPONIBLE", "NO DISPONIBLE")) for url in urls]
+    prices: List[str] = [price for price, _ in results]
+    sellers: List[str] = [vendor for _, vendor in results]
+    # Cursor for next run
     next_row = start_row + len(urls)
     # If we've processed past the end, wrap around to row 2
-    last_data_row = len(worksheet.get_all_values())
     if next_row > last_data_row:
         next_row = 2
-    worksheet.update_acell("A100000", str(next_row))
+    # Write back to sheet, advancing the cursor in the same request
+    _write_results(
+        worksheet, start_row, sellers, prices, time_zone=tz, header_index=header_index, next_row=next_row
+    )
     print(f"Processed rows {start_row} through {start_row + len(urls) - 1}.")
 
 